@@ -1,11 +1,11 @@
 import numpy as np
 
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 from abc import abstractmethod
 from onnxruntime import InferenceSession
 
-from .utils import ort_type_to_dtype
+from .utils import ort_type_to_dtype, build_session
 
 class ORTModelBase:
     def __init__(self, session:InferenceSession):
@@ -44,6 +44,21 @@ class ORTModelBase:
             bindings[session_output.name] = outputs[idx]
         return bindings
     
+    @classmethod
+    def build_session(
+        cls,
+        model_path: str,
+        intra: Optional[int] = None,
+        inter: int = 1,
+        mode: str = "sequential",
+        providers: Optional[List[str]] = None,
+    ) -> InferenceSession:
+        """
+        construct an InferenceSession with graph optimizations enabled and
+        thread counts tuned for batch-1 latency ('sequential') or throughput ('parallel').
+        """
+        return build_session(model_path, intra=intra, inter=inter, mode=mode, providers=providers)
+
     @abstractmethod
     def forward(self, *args, **kwargs):
         pass
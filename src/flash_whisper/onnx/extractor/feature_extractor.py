@@ -6,7 +6,7 @@ from enum import Enum
 from typing import Optional, Union, List, Dict, Any
 from collections import UserDict
 
-from .mel_processing import stft_np, mel_filter_bank, spectrogram, window_function
+from .mel_processing import stft_np, mel_filter_bank
 
 logger = logging.getLogger(__name__)
 
@@ -308,34 +308,20 @@ class WhisperFeatureExtractor(SequenceFeatureExtractor):
             norm="slaney",
             mel_scale="slaney",
         )
-        
+        # float32 transposed copy so the mel projection is a single float32 GEMM
+        self._mel_filters_f32 = np.ascontiguousarray(self.mel_filters.T, dtype=np.float32)
+
     def _np_extract_fbank_features(self, waveform_batch: np.array) -> np.ndarray:
+        return self._extract_fbank_features(np.asarray(waveform_batch, dtype=np.float32))
 
-        log_spec_batch = []
-        for waveform in waveform_batch:
-            log_spec = spectrogram(
-                waveform,
-                window_function(self.n_fft, "hann"),
-                frame_length=self.n_fft,
-                hop_length=self.hop_length,
-                power=2.0,
-                mel_filters=self.mel_filters,
-                log_mel="log10",
-            )
-            log_spec = log_spec[:, :-1]
-            log_spec = np.maximum(log_spec, log_spec.max() - 8.0)
-            log_spec = (log_spec + 4.0) / 4.0
-            log_spec_batch.append(log_spec)
-        log_spec_batch = np.array(log_spec_batch)
-        return log_spec_batch
-    
     def _extract_fbank_features(self, waveform: np.array) -> np.ndarray:
-    
-        stft = stft_np(waveform, self.n_fft, self.hop_length)
 
-        magnitudes = (np.abs(stft[..., :-1]) ** 2).astype(np.float32)
+        stft = stft_np(waveform, self.n_fft, self.hop_length)[..., :-1]
+
+        # |X|^2 without the intermediate complex abs; stays float32 throughout
+        magnitudes = stft.real ** 2 + stft.imag ** 2
 
-        mel_spec = np.einsum('ij,ajb->aib', self.mel_filters.astype(np.float32).T, magnitudes)
+        mel_spec = self._mel_filters_f32 @ magnitudes
         log_spec = np.log10(np.clip(mel_spec, a_min=1e-10, a_max=None))
         max_val = np.max(log_spec, axis=2, keepdims=True)
         max_val = np.max(max_val, axis=1, keepdims=True)
@@ -1,7 +1,18 @@
 import numpy as np
+import scipy.fft
 
 from typing import Union, Optional
 
+# Hann windows keyed by n_fft, kept as float32 so framing stays single precision
+_hann_window_cache = {}
+
+def _hann_window(n_fft: int) -> np.ndarray:
+    window = _hann_window_cache.get(n_fft)
+    if window is None:
+        window = (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(n_fft) / n_fft)).astype(np.float32)
+        _hann_window_cache[n_fft] = window
+    return window
+
 def hertz_to_mel(freq: Union[float, np.ndarray], mel_scale: str = "htk") -> Union[float, np.ndarray]:
     if mel_scale not in ["slaney", "htk", "kaldi"]:
         raise ValueError('mel_scale should be one of "htk", "slaney" or "kaldi".')
@@ -286,19 +297,20 @@ def window_function(
     return padded_window
 
 def stft_np(waveform, n_fft, hop_length):
-    
+
     pad = int(n_fft // 2)
-    waveform = np.pad(waveform, ((0,0), (pad,pad)), "reflect")
+    waveform = np.pad(waveform.astype(np.float32, copy=False), ((0,0), (pad,pad)), "reflect")
     batch_size, signal_length = waveform.shape
-    window_fn = 0.5 - 0.5 * np.cos(2 * np.pi * np.arange(n_fft) / n_fft)
+    window_fn = _hann_window(n_fft)
     num_frames = 1 + (signal_length - n_fft) // hop_length
-    
+
     frames = np.lib.stride_tricks.as_strided(
         waveform,
         shape=(batch_size, num_frames, n_fft),
         strides=(waveform.strides[0], waveform.strides[1] * hop_length, waveform.strides[1])
     ) * window_fn[np.newaxis, np.newaxis, :]
-    
-    stft_matrix = np.fft.rfft(frames, n=n_fft, axis=2)
-    
+
+    # pocketfft batches the 400-sample frames in one call and keeps float32 lanes
+    stft_matrix = scipy.fft.rfft(frames, n=n_fft, axis=2, workers=-1)
+
     return stft_matrix.transpose(0, 2, 1)
\ No newline at end of file
@@ -1,4 +1,3 @@
-import copy
 import logging
 import numpy as np
 
@@ -20,7 +19,24 @@ class WhisperProcessor:
     def __init__(self, config_dir):
         self.generation_config = GenerationConfig(config_dir)
         self.feature_extractor = WhisperFeatureExtractor(config_dir)
-        
+        self._lang_to_token_id = self._build_language_index()
+
+    def _build_language_index(self) -> Dict[str, int]:
+        # one hash lookup per language instead of re-scanning lang_to_id and
+        # TO_LANGUAGE_CODE (including its O(N) .values() scan) per batch element
+        lang_to_id = getattr(self.generation_config, "lang_to_id", None)
+        if lang_to_id is None:
+            return {}
+
+        index = dict(lang_to_id)
+        for name, code in TO_LANGUAGE_CODE.items():
+            token_id = lang_to_id.get(f"<|{code}|>")
+            if token_id is not None:
+                index[name] = token_id
+                index[code] = token_id
+
+        return index
+
     def extraction(self, audio: np.ndarray, sampling_rate:int) -> Dict[str, Union[List, np.ndarray]]:
         return self.feature_extractor(audio, sampling_rate=sampling_rate)
     
@@ -44,25 +60,24 @@ class WhisperProcessor:
         
         def language_to_id(language: str) -> int:
             language = language.lower()
-            if language in self.generation_config.lang_to_id.keys():
-                language_token = language
-            elif language in TO_LANGUAGE_CODE.keys():
-                language_token = f"<|{TO_LANGUAGE_CODE[language]}|>"
-            elif language in TO_LANGUAGE_CODE.values():
-                language_token = f"<|{language}|>"
-            else:
-                is_language_code = len(language) == 2
-                raise ValueError(
-                    f"Unsupported language: {language}. Language should be one of:"
-                    f" {list(TO_LANGUAGE_CODE.values()) if is_language_code else list(TO_LANGUAGE_CODE.keys())}."
-                )
-            if language_token not in self.generation_config.lang_to_id:
+            token_id = self._lang_to_token_id.get(language)
+            if token_id is None:
+                if language in TO_LANGUAGE_CODE:
+                    language_token = f"<|{TO_LANGUAGE_CODE[language]}|>"
+                elif language in TO_LANGUAGE_CODE.values():
+                    language_token = f"<|{language}|>"
+                else:
+                    is_language_code = len(language) == 2
+                    raise ValueError(
+                        f"Unsupported language: {language}. Language should be one of:"
+                        f" {list(TO_LANGUAGE_CODE.values()) if is_language_code else list(TO_LANGUAGE_CODE.keys())}."
+                    )
                 raise ValueError(
                     f"{language_token} is not supported by this specific model as it is not in the `self.generation_config.lang_to_id`."
                     "(You should just add it to the generation config)"
                 )
 
-            return self.generation_config.lang_to_id[language_token]
+            return token_id
 
         language = getattr(self.generation_config, "language", None)
         
@@ -101,48 +116,50 @@ class WhisperProcessor:
                 )
             languages = language
         elif language is None:
-            languages = [None] * batch_size
+            languages = None
         else:
-            languages = [language]
+            languages = [language] * batch_size
 
-        init_tokens = [copy.copy(init_tokens) for _ in languages]
-        
         lang_ids = None
-        if language is not None:
-            lang_ids = [language_to_id(l) for l in languages]
-        
+        if languages is not None:
+            lang_ids = np.fromiter((language_to_id(l) for l in languages), dtype=np.int64, count=batch_size)
+
         elif hasattr(self.generation_config, "lang_to_id") and is_lang_id_undefined:
-            lang_ids = [language_to_id("en")] * batch_size
-        
+            lang_ids = np.full(batch_size, language_to_id("en"), dtype=np.int64)
+
+        # every row shares the same prompt layout; only the language slot can vary,
+        # so assemble the prompt column-by-column instead of building a list per row
+        columns = list(init_tokens)
         if lang_ids is not None:
-            for i in range(len(init_tokens)):
-                if len(init_tokens[i]) > 1:
-                    init_tokens[i][1] = lang_ids[i]
-                else:
-                    init_tokens[i].append(lang_ids[i])
-                    
-        del languages
-
-        for i in range(len(init_tokens)):
-            if language is not None and hasattr(self.generation_config, "task_to_id"):
-                # if language is defined, but no task id is in `init_tokens`, default to transcribe
-                if not any(ti in init_tokens[i] for ti in self.generation_config.task_to_id.values()):
-                    init_tokens[i].append(self.generation_config.task_to_id["transcribe"])
-
-            if (
-                not self.generation_config.return_timestamps
-                and hasattr(self.generation_config, "no_timestamps_token_id")
-                and init_tokens[i][-1] != self.generation_config.no_timestamps_token_id
-            ):
-                init_tokens[i].append(self.generation_config.no_timestamps_token_id)
-            elif (
-                self.generation_config.return_timestamps and init_tokens[i][-1] == self.generation_config.no_timestamps_token_id
-            ):
-                logger.info(
-                    "<|notimestamps|> prompt token is removed from self.generation_config since `return_timestamps` is set to `'True'`."
-                )
-                init_tokens[i] = init_tokens[i][:-1]
+            if len(columns) > 1:
+                columns[1] = lang_ids
+            else:
+                columns.append(lang_ids)
 
-            init_tokens[i] = [t for t in init_tokens[i] if t is not None]
-            
-        return np.tile(np.array(init_tokens, dtype=np.int64), (batch_size, 1))
\ No newline at end of file
+        columns = [c for c in columns if c is not None]
+
+        if language is not None and hasattr(self.generation_config, "task_to_id"):
+            # if language is defined, but no task id is in the prompt, default to transcribe
+            task_ids = self.generation_config.task_to_id.values()
+            if not any(np.ndim(c) == 0 and c in task_ids for c in columns):
+                columns.append(self.generation_config.task_to_id["transcribe"])
+
+        no_timestamps_token_id = getattr(self.generation_config, "no_timestamps_token_id", None)
+        ends_with_no_timestamps = np.ndim(columns[-1]) == 0 and columns[-1] == no_timestamps_token_id
+        if (
+            not self.generation_config.return_timestamps
+            and no_timestamps_token_id is not None
+            and not ends_with_no_timestamps
+        ):
+            columns.append(no_timestamps_token_id)
+        elif self.generation_config.return_timestamps and ends_with_no_timestamps:
+            logger.info(
+                "<|notimestamps|> prompt token is removed from self.generation_config since `return_timestamps` is set to `'True'`."
+            )
+            columns = columns[:-1]
+
+        out = np.empty((batch_size, len(columns)), dtype=np.int64)
+        for i, column in enumerate(columns):
+            out[:, i] = column
+
+        return out
\ No newline at end of file
@@ -3,7 +3,7 @@ import numpy as np
 import onnxruntime as ort
 
 from glob import glob
-from typing import Dict
+from typing import Dict, List, Optional
 
 def ort_type_to_dtype(dtype):
 
@@ -23,8 +23,50 @@ def ort_type_to_dtype(dtype):
     return expected_dtype
 
 
+def build_session(
+    model_path: str,
+    intra: Optional[int] = None,
+    inter: int = 1,
+    mode: str = "sequential",
+    providers: Optional[List[str]] = None,
+) -> ort.InferenceSession:
+
+    sess_options = ort.SessionOptions()
+    sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    sess_options.intra_op_num_threads = intra if intra is not None else max(1, os.cpu_count() // 2)
+    sess_options.inter_op_num_threads = inter
+    sess_options.execution_mode = (
+        ort.ExecutionMode.ORT_SEQUENTIAL if mode == "sequential" else ort.ExecutionMode.ORT_PARALLEL
+    )
+    # decoder inputs grow every step, so memory patterns never get reused
+    sess_options.enable_mem_pattern = False
+
+    return ort.InferenceSession(model_path, sess_options=sess_options, providers=providers)
+
+
+def quantize_model(model_path: str, output_path: Optional[str] = None) -> str:
+    """
+    quantize MatMul weights of an exported model to int8 (dynamic activations).
+    writes `<model>.int8.onnx` next to the original, which initialize_model
+    then prefers over the fp32 file.
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    if output_path is None:
+        output_path = model_path[:-len(".onnx")] + ".int8.onnx"
+
+    quantize_dynamic(model_path, output_path, weight_type=QuantType.QInt8, op_types_to_quantize=["MatMul"])
+
+    return output_path
+
+
 def initialize_model(model_dir:str) -> Dict:
     model_file = glob(os.path.join(model_dir, "*.onnx"))
-    model_map = {os.path.basename(mf): ort.InferenceSession(mf) for mf in model_file}
-    
+
+    # prefer the int8-quantized variant of a model when both files are present
+    int8_file = {mf for mf in model_file if mf.endswith(".int8.onnx")}
+    model_file = [mf for mf in model_file if mf in int8_file or mf[:-len(".onnx")] + ".int8.onnx" not in int8_file]
+
+    model_map = {os.path.basename(mf): build_session(mf) for mf in model_file}
+
     return model_map
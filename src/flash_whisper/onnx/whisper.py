@@ -11,13 +11,59 @@ from .processor.processor import WhisperProcessor
 from .tokenizer.tokenizer_whisper import WhisperTokenizer
 
 class ORTEncoder(ORTModelBase):
-    
+
     def __init__(self, session: InferenceSession):
         super().__init__(session)
-    
+        self._io_binding = self.session.io_binding()
+        self._output_buffers = {}
+
     def forward(self, inputs: List[np.ndarray], **kwargs) -> Dict[str, np.ndarray]:
-        out = self.session.run(None, self.binding_inputs(inputs))
-        return self.binding_outputs(out)
+        """
+        run the encoder with outputs written into buffers that persist across
+        calls. the returned arrays are views into those buffers and are
+        overwritten by the next forward, so copy them if they must outlive it.
+        """
+        bindings = self.binding_inputs(inputs)
+        batch_size = inputs[0].shape[0]
+
+        io_binding = self._io_binding
+        io_binding.clear_binding_inputs()
+        io_binding.clear_binding_outputs()
+
+        # bind inputs zero-copy from the numpy buffers instead of letting
+        # session.run stage them; keep references alive until the run returns
+        bound_inputs = []
+        for name, array in bindings.items():
+            array = np.ascontiguousarray(array)
+            bound_inputs.append(array)
+            io_binding.bind_input(
+                name,
+                device_type="cpu",
+                device_id=0,
+                element_type=array.dtype,
+                shape=array.shape,
+                buffer_ptr=array.ctypes.data,
+            )
+
+        outputs = {}
+        for session_output in self.session.get_outputs():
+            shape = tuple(batch_size if isinstance(dim, str) else dim for dim in session_output.shape)
+            buffer = self._output_buffers.get(session_output.name)
+            if buffer is None or buffer.shape != shape:
+                buffer = np.empty(shape, dtype=ort_type_to_dtype(session_output.type))
+                self._output_buffers[session_output.name] = buffer
+            io_binding.bind_output(
+                session_output.name,
+                device_type="cpu",
+                device_id=0,
+                element_type=buffer.dtype,
+                shape=shape,
+                buffer_ptr=buffer.ctypes.data,
+            )
+            outputs[session_output.name] = buffer
+
+        self.session.run_with_iobinding(io_binding)
+        return outputs
 
 class ORTDecoder(ORTModelBase):
     def __init__(self, session: InferenceSession):
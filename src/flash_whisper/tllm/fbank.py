@@ -5,6 +5,47 @@ import torch.nn.functional as F
 
 from typing import Union
 
+try:
+    import triton
+    import triton.language as tl
+    HAS_TRITON = True
+except ImportError:
+    HAS_TRITON = False
+
+_LOG10_OF_2 = 0.3010299956639812
+
+if HAS_TRITON:
+
+    @triton.jit
+    def _fused_log_mel_kernel(mel_ptr, max_ptr, out_ptr, n_elements, row_elements, BLOCK_SIZE: tl.constexpr):
+        pid = tl.program_id(0)
+        offsets = pid * BLOCK_SIZE + tl.arange(0, BLOCK_SIZE)
+        mask = offsets < n_elements
+
+        # log10 is monotonic, so each sample's power max gives the same floor
+        # as taking the max over that sample's log spectrum
+        rows = offsets // row_elements
+        mel_max = tl.load(max_ptr + rows, mask=mask, other=1.0).to(tl.float32)
+        log_max = tl.log2(tl.maximum(mel_max, 1e-10)) * _LOG10_OF_2
+
+        x = tl.load(mel_ptr + offsets, mask=mask, other=1.0).to(tl.float32)
+        x = tl.log2(tl.maximum(x, 1e-10)) * _LOG10_OF_2
+        x = tl.maximum(x, log_max - 8.0)
+        x = (x + 4.0) / 4.0
+        tl.store(out_ptr + offsets, x.to(out_ptr.dtype.element_ty), mask=mask)
+
+    def _fused_log_mel(mel_spec: torch.Tensor) -> torch.Tensor:
+        # one per-sample reduction + one fused elementwise pass instead of the
+        # clamp -> log10 -> maximum -> add -> div kernel chain
+        mel_spec = mel_spec.contiguous()
+        out = torch.empty_like(mel_spec)
+        mel_max = mel_spec.amax(dim=(-2, -1)).reshape(-1).contiguous()
+        n_elements = mel_spec.numel()
+        row_elements = mel_spec.shape[-2] * mel_spec.shape[-1]
+        grid = lambda meta: (triton.cdiv(n_elements, meta["BLOCK_SIZE"]),)
+        _fused_log_mel_kernel[grid](mel_spec, mel_max, out, n_elements, row_elements, BLOCK_SIZE=1024)
+        return out
+
 def mel_filters(device, n_mels:int = 128) -> torch.Tensor:
     
     assert n_mels == 80 or n_mels == 128, f"Unsupported n_mels: {n_mels}"
@@ -23,29 +64,42 @@ def log_mel_spectrogram(
     window = torch.hann_window(n_fft).to(audio.device)
     stft = torch.stft(audio, n_fft, hop_length, window=window, return_complex=True)
     magnitudes = stft[..., :-1].abs() ** 2
-    
-    mel_spec = filters @ magnitudes
-    log_spec = torch.clamp(mel_spec, min=1e-10).log10()
-    log_spec = torch.maximum(log_spec, log_spec.max() - 8.0)
+
+    # the FFT stays fp32 for stability (cuFFT has no half R2C at this size);
+    # the power spectrum then drops to the engine dtype so the mel GEMM moves
+    # half the bytes. project as (frames, freq) @ (freq, n_mels) so the output
+    # is already contiguous in the (T, n_mels) layout the engine consumes
+    mel_spec = magnitudes.to(filters.dtype).transpose(-2, -1) @ filters.T
+
+    if HAS_TRITON and mel_spec.is_cuda:
+        return _fused_log_mel(mel_spec)
+
+    log_spec = torch.clamp(mel_spec.float(), min=1e-10).log10()
+    # the dynamic-range floor is per sample, as in per-clip extraction; a
+    # batch-wide max would clip quieter clips against the loudest in the batch
+    log_spec = torch.maximum(log_spec, log_spec.amax(dim=(-2, -1), keepdim=True) - 8.0)
     log_spec = (log_spec + 4.0) / 4.0
-    
-    log_spec = log_spec.half()
-    return log_spec
+
+    return log_spec.to(filters.dtype)
 
 class FeatureExtractor(torch.nn.Module):
     
-    def __init__(self, n_mels:int = 128):
+    def __init__(self, n_mels:int = 128, dtype:torch.dtype = torch.float16):
         self.device = torch.device("cuda")
         self.n_mels = n_mels
-        self.filters = mel_filters(self.device, n_mels=self.n_mels)
+        self.dtype = dtype
+        # match the engine's encoder input dtype (fp16 for standard builds)
+        self.filters = mel_filters(self.device, n_mels=self.n_mels).to(dtype)
         
     def compute_feature(self, wav, padding_target_len:int = 3000):
+        # accepts a single (T,) wav or a stacked (B, T) batch; always returns (B, frames, n_mels)
         mel = log_mel_spectrogram(wav, self.filters)
         assert padding_target_len <= 3000, f"padding must be less than 3000, got {padding_target_len}"
-        if mel.shape[1] < padding_target_len:
-            mel = F.pad(mel, (0, padding_target_len - mel.shape[1]), mode='constant')
-        if mel.shape[1] % 2:
-            mel = F.pad(mel, (0, 1))
-            
-        mel = mel.unsqueeze(0)
+        if mel.shape[-2] < padding_target_len:
+            mel = F.pad(mel, (0, 0, 0, padding_target_len - mel.shape[-2]), mode='constant')
+        if mel.shape[-2] % 2:
+            mel = F.pad(mel, (0, 0, 0, 1))
+
+        if mel.dim() == 2:
+            mel = mel.unsqueeze(0)
         return mel
\ No newline at end of file
@@ -1,6 +1,6 @@
 import re
-import time
 import json
+import inspect
 import torch
 import numpy as np
 
@@ -9,10 +9,18 @@ from .tokenizer import get_tokenizer
 
 from pathlib import Path
 from typing import List, Union, Optional
+from functools import lru_cache
 from collections import OrderedDict
 from tensorrt_llm.runtime import ModelRunnerCpp
 from tensorrt_llm.bindings import GptJsonConfig
 
+# one 30s clip at 16kHz; the staging buffer grows past this for larger batches
+MAX_WAV_SAMPLES = 30 * 16000
+
+_SPECIAL_TOKEN_RE = re.compile(r'<\|.*?\|>')
+
+DEFAULT_PROMPT = "<|startoftranscript|><|en|><|transcribe|><|notimestamps|>"
+
 
 def read_config(component, engine_dir):
     config_path = engine_dir / component / 'config.json'
@@ -39,7 +47,13 @@ class WhisperTRTLLM:
             debug_mode=False,
             kv_cache_free_gpu_memory_fraction=0.75
         )
-        
+
+        # decode steps run with stable shapes, so let the runtime capture them
+        # as CUDA graphs and replay instead of relaunching per step; older
+        # TRT-LLM runners lack the kwarg, in which case stay eager
+        if "cuda_graph_mode" in inspect.signature(ModelRunnerCpp.from_dir).parameters:
+            runner_kwargs["cuda_graph_mode"] = True
+
         self.model_runner_cpp = ModelRunnerCpp.from_dir(**runner_kwargs)
         self.feature_extractor = FeatureExtractor(n_mels=n_mels)
         self.zero_pad = zero_pad
@@ -49,6 +63,17 @@ class WhisperTRTLLM:
         self.tokenizer = get_tokenizer(num_languages=encoder_config['num_languages'])
         self.blank = self.tokenizer.encode(" ", allowed_special=self.tokenizer.special_tokens_set)[0]
         self.device = torch.device("cuda")
+
+        # tokenizing the prompt is a BPE pass per request; memoize it and warm
+        # the cache with the default prompt so the common path never encodes
+        self._encode_prompt = lru_cache(maxsize=64)(
+            lambda prompt: self.tokenizer.encode(prompt, allowed_special=self.tokenizer.special_tokens_set)
+        )
+        self._encode_prompt(DEFAULT_PROMPT)
+
+        # reusable pinned staging buffer so wav uploads run as async DMA copies
+        # instead of synchronous pageable transfers (sized for one 30s 16kHz clip)
+        self._pinned = torch.empty(MAX_WAV_SAMPLES, dtype=torch.float32, pin_memory=True)
         
     def __call__(
         self,
@@ -68,13 +93,13 @@ class WhisperTRTLLM:
                 wav_length = [length] * batch
                 
         if language is None:
-            prompt_ids = "<|startoftranscript|><|en|><|transcribe|><|notimestamps|>"
+            prompt = DEFAULT_PROMPT
         else:
-            prompt_ids = f"<|startoftranscript|><|{language}|><|transcribe|><|notimestamps|>"
-                
-        prompt_ids = self.tokenizer.encode(prompt_ids, allowed_special=self.tokenizer.special_tokens_set)
+            prompt = f"<|startoftranscript|><|{language}|><|transcribe|><|notimestamps|>"
+
+        prompt_ids = self._encode_prompt(prompt)
         output_ids = self.process_batch(wav, wav_length, prompt_ids)
-        s = [re.sub(r'<\|.*?\|>', '', self.tokenizer.decode(output_id)) for output_id in output_ids] 
+        s = [_SPECIAL_TOKEN_RE.sub('', text) for text in self.tokenizer.decode_batch(output_ids)]
         return s
     
     def process_batch(
@@ -83,25 +108,45 @@ class WhisperTRTLLM:
         wav_lengths,
         prompt_ids,
     ):
-        batch_mel_list, decoder_input_ids = [], []
-        for wav, wav_len in zip(waves, wav_lengths):
-            wav = torch.from_numpy(wav).to(self.device)
-            prompt_ids = torch.tensor(prompt_ids).unsqueeze(0)
+        prompt_ids = torch.as_tensor(prompt_ids, dtype=torch.int32, device=self.device)
+        padding = 0 if self.zero_pad else 3000
 
-            wav = wav[:wav_len]
-            padding = 0 if self.zero_pad else 3000
+        # stack the request into one (B, T_max) tensor so the STFT + mel matmul
+        # run as a single batched kernel instead of one launch per sample
+        batch_size = len(waves)
+        max_len = int(max(wav_lengths))
+        if batch_size * max_len > self._pinned.numel():
+            self._pinned = torch.empty(batch_size * max_len, dtype=torch.float32, pin_memory=True)
+        staging = self._pinned[:batch_size * max_len].view(batch_size, max_len)
+        staging.zero_()
+        for i, (wav, wav_len) in enumerate(zip(waves, wav_lengths)):
+            staging[i, :wav_len].copy_(torch.from_numpy(wav[:wav_len]))
+        wav_batch = staging.to(self.device, non_blocking=True)
 
-            mel = self.feature_extractor.compute_feature(wav.to('cuda'), padding_target_len=padding).transpose(1, 2)
-            
-            batch_mel_list.append(mel.squeeze(0))
-            decoder_input_ids.append(prompt_ids.int().to("cuda").squeeze(0))
+        mel = self.feature_extractor.compute_feature(wav_batch, padding_target_len=padding)
+
+        # every sample shares the same prompt, so a broadcast + one contiguous
+        # allocation replaces the variable-length pad_sequence machinery
+        decoder_input_ids = prompt_ids.unsqueeze(0).expand(batch_size, -1).contiguous()
 
-        decoder_input_ids = torch.nn.utils.rnn.pad_sequence(decoder_input_ids, batch_first=True, padding_value=self.eot_id)
-        mel_input_lengths = torch.tensor([mel.shape[0] for mel in batch_mel_list], dtype=torch.int32, device='cuda')
+        if self.zero_pad:
+            # ragged request: report each sample's true frame count (stft frames
+            # minus the dropped last one, rounded up to even as compute_feature
+            # pads), not the batch-padded T_max that includes mel-of-silence
+            lengths = [(wav_len // 160 + 1) // 2 * 2 for wav_len in wav_lengths]
+            mel_input_lengths = torch.tensor(lengths, dtype=torch.int32, pin_memory=True).to(
+                self.device, non_blocking=True
+            )
+        else:
+            # every mel is padded to the same 3000-frame target, so fill the
+            # constant lengths on device instead of building a host list
+            mel_input_lengths = torch.full((batch_size,), mel.shape[1], dtype=torch.int32, device=self.device)
 
+        # the runner API takes a list of per-sample features; unbind at the last
+        # moment so the entries stay zero-copy views into the one mel tensor
         outputs = self.model_runner_cpp.generate(
             batch_input_ids=decoder_input_ids,
-            encoder_input_features=batch_mel_list,
+            encoder_input_features=list(mel.unbind(0)),
             encoder_output_lengths=mel_input_lengths // 2,
             max_new_tokens=124,
             end_id=self.eot_id,
@@ -109,9 +154,9 @@ class WhisperTRTLLM:
             num_beams=1,
             output_sequence_lengths=True,
             return_dict=True)
-        
-        torch.cuda.synchronize()
-        
+
+        # no explicit synchronize: the .cpu() copy below already waits for the
+        # stream, so the host stays free to enqueue the next batch's work
         output_ids = outputs['output_ids'][0].cpu().numpy()
         
         return output_ids
\ No newline at end of file